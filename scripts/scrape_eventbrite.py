@@ -4,29 +4,95 @@ Scrape Eventbrite for veteran events in Montana and Wyoming over the next 60 day
 This script uses the Eventbrite API and writes a JSON file with a list of events or an error message.
 """
 
+import hashlib
 import json
+import logging
 import os
 import sys
+import threading
 import time
-from typing import Dict, List, Tuple
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from datetime import date, timedelta
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None
+
+log = logging.getLogger("eventbrite")
 
 API_BASE = "https://www.eventbriteapi.com/v3"
+SEARCH_URL = f"{API_BASE}/events/search"
 OUT_FILE = "events.json"
+JSONL_FILE = "events.jsonl"
 
 DEFAULT_STATES = ["Montana", "Wyoming"]
 DEFAULT_QUERY = os.environ.get(
     "EVENTBRITE_QUERY",
-    "veteran OR veterans OR military OR service member",
+    'veteran OR veterans OR military OR "service member"',
 )
 DEFAULT_WITHIN = os.environ.get("EVENTBRITE_WITHIN", "500mi")
 LOOKAHEAD_DAYS = int(os.environ.get("EVENTBRITE_DAYS", "60"))
-PAGE_DELAY_SEC = float(os.environ.get("EVENTBRITE_PAGE_DELAY_SEC", "0.5"))
+MAX_RETRY_AFTER_SEC = 60
+PAGE_WORKERS = int(os.environ.get("EVENTBRITE_PAGE_WORKERS", "4"))
+TOKEN_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "vnn-events")
+# The workflow runs daily; the marker outlives that period by half a day so
+# cron jitter cannot expire it just before the next run.
+SCHEDULE_PERIOD_SEC = 24 * 60 * 60
+TOKEN_CACHE_TTL_SEC = SCHEDULE_PERIOD_SEC * 3 // 2
+
+# Caps in-flight search requests across every state and page worker, so the
+# fan-out stays at PAGE_WORKERS without sleeping between pages.
+REQUEST_SLOTS = threading.BoundedSemaphore(max(1, PAGE_WORKERS))
+
+class CappedRetry(Retry):
+    """Retry that waits at most MAX_RETRY_AFTER_SEC for a Retry-After.
+
+    urllib3 sleeps for whatever the server asks, so one large value could
+    stall the run (while holding a REQUEST_SLOTS slot) for hours.
+    """
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER_SEC)
+
+# Shared keep-alive pool for the token check and every state/page request.
+# Retry backs off exponentially with jitter on 429 and gateway errors and
+# honours Retry-After up to the cap; raise_on_status=False hands the last
+# response back so the status checks below still report it.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=CappedRetry(total=5, backoff_factor=1.0, backoff_jitter=0.5,
+                      status_forcelist=[429, 502, 503, 504],
+                      raise_on_status=False),
+))
 
 def save_json(payload: Dict, path: str = OUT_FILE) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    # Serialize up front and hand the file one buffer; json.dump would issue
+    # a write per encoder chunk.
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(data)
+
+def save_jsonl(events: List[Dict], path: str = JSONL_FILE) -> None:
+    # One event per line, so consumers can stream the feed instead of loading
+    # the whole document.
+    if orjson is not None:
+        lines = [orjson.dumps(e) + b"\n" for e in events]
+    else:
+        lines = [json.dumps(e, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n" for e in events]
+    with open(path, "wb") as f:
+        f.writelines(lines)
 
 def get_token() -> str:
     token = os.environ.get("EVENTBRITE_TOKEN")
@@ -35,9 +101,9 @@ def get_token() -> str:
         sys.exit(2)
     return token
 
-def validate_token(session: requests.Session, headers: Dict[str, str]) -> None:
+def validate_token(session: requests.Session) -> None:
     url = f"{API_BASE}/users/me/"
-    resp = session.get(url, headers=headers, timeout=15)
+    resp = session.get(url, timeout=15)
     if resp.status_code == 200:
         return
     if resp.status_code in (401, 403):
@@ -46,7 +112,61 @@ def validate_token(session: requests.Session, headers: Dict[str, str]) -> None:
         raise RuntimeError(f"Rate limited during token validation: {resp.text[:200]}")
     raise RuntimeError(f"Unexpected status {resp.status_code} during token validation: {resp.text[:200]}")
 
-def search_region(session: requests.Session, headers: Dict[str, str], query: str,
+def get_page(session: requests.Session, params: Dict,
+             location_address: str) -> Tuple[Optional[Dict], Optional[str]]:
+    # 429s are retried (and Retry-After honoured) by the session's adapter
+    with REQUEST_SLOTS:
+        resp = session.get(SEARCH_URL, params=params, timeout=30)
+    log.debug("Page %s for %s: status %d", params["page"], location_address, resp.status_code)
+    if resp.status_code == 404:
+        return None, f"404 for {location_address}: {resp.text[:200]}"
+    if resp.status_code in (401, 403):
+        return None, f"Auth error {resp.status_code} for {location_address}: {resp.text[:200]}"
+    if resp.status_code == 429:
+        return None, f"Rate limit (429) for {location_address}: {resp.text[:200]}"
+    if resp.status_code != 200:
+        return None, f"HTTP {resp.status_code} for {location_address}: {resp.text[:200]}"
+    try:
+        if orjson is not None:
+            return orjson.loads(resp.content), None
+        return resp.json(), None
+    except ValueError:  # orjson.JSONDecodeError subclasses ValueError
+        return None, f"Invalid JSON response for {location_address}: {resp.text[:200]}"
+
+# Only these keys of a search result are read downstream.
+EVENT_FIELDS = ("name", "url", "start", "end", "venue")
+
+def page_events(data: Dict) -> List[Dict]:
+    # Project each event down to EVENT_FIELDS so the rest of the page
+    # (descriptions, logos, ticket info, ...) can be freed right away instead
+    # of staying alive until every region has been fetched.
+    return [{k: e.get(k) for k in EVENT_FIELDS} for e in data.get("events", []) or []]
+
+def token_marker(token: str) -> str:
+    digest = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(TOKEN_CACHE_DIR, f"token-{digest}")
+
+def token_recently_validated(token: str) -> bool:
+    try:
+        return os.path.getmtime(token_marker(token)) > time.time() - TOKEN_CACHE_TTL_SEC
+    except OSError:
+        return False
+
+def mark_token_validated(token: str) -> None:
+    try:
+        os.makedirs(TOKEN_CACHE_DIR, exist_ok=True)
+        with open(token_marker(token), "w"):
+            pass
+    except OSError:
+        pass  # the marker is only an optimization
+
+def forget_token(token: str) -> None:
+    try:
+        os.remove(token_marker(token))
+    except OSError:
+        pass
+
+def search_region(session: requests.Session, query: str,
                   location_address: str, within: str) -> Tuple[List[Dict], List[str]]:
     params = {
         "q": query,
@@ -58,90 +178,141 @@ def search_region(session: requests.Session, headers: Dict[str, str], query: str
     }
     results = []
     warnings = []
+    data, warn = get_page(session, params, location_address)
+    if data is None:
+        return results, [warn]
+    results.extend(page_events(data))
+    pagination = data.get("pagination", {})
+    if not pagination.get("has_more_items"):
+        return results, warnings
+
+    # The first page reports page_count, so the remaining pages can be
+    # requested together (at most PAGE_WORKERS at a time). Pages are consumed
+    # in order and the first failure ends the region, as before; the pages
+    # not yet started are cancelled so they are never sent.
+    page_count = pagination.get("page_count")
+    if page_count:
+        pages = [{**params, "page": p} for p in range(2, page_count + 1)]
+        extend = results.extend
+        with ThreadPoolExecutor(max_workers=max(1, PAGE_WORKERS)) as pool:
+            futures = [pool.submit(get_page, session, p, location_address) for p in pages]
+            for future in futures:
+                data, warn = future.result()
+                if data is None:
+                    warnings.append(warn)
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    break
+                extend(page_events(data))
+        return results, warnings
+
+    # No page_count in the response: walk the pages one at a time.
     while True:
-        resp = session.get(f"{API_BASE}/events/search", headers=headers, params=params, timeout=30)
-        if resp.status_code == 404:
-            warnings.append(f"404 for {location_address}: {resp.text[:200]}")
-            break
-        if resp.status_code in (401, 403):
-            warnings.append(f"Auth error {resp.status_code} for {location_address}: {resp.text[:200]}")
-            break
-        if resp.status_code == 429:
-            warnings.append(f"Rate limit (429) for {location_address}: {resp.text[:200]}")
-            break
-        if resp.status_code != 200:
-            warnings.append(f"HTTP {resp.status_code} for {location_address}: {resp.text[:200]}")
-            break
-        try:
-            data = resp.json()
-        except ValueError:
-            warnings.append(f"Invalid JSON response for {location_address}: {resp.text[:200]}")
+        params["page"] += 1
+        data, warn = get_page(session, params, location_address)
+        if data is None:
+            warnings.append(warn)
             break
-        results.extend(data.get("events", []) or [])
+        results.extend(page_events(data))
         if not data.get("pagination", {}).get("has_more_items"):
             break
-        params["page"] += 1
-        time.sleep(PAGE_DELAY_SEC)
     return results, warnings
 
-def normalize_events(events: List[Dict]) -> List[Dict]:
-    normalized = []
-    for e in events:
-        venue = e.get("venue") or {}
-        address = venue.get("address") or {}
-        normalized.append({
-            "name": (e.get("name") or {}).get("text"),
-            "url": e.get("url"),
-            "start": (e.get("start") or {}).get("local"),
-            "end": (e.get("end") or {}).get("local"),
-            "city": address.get("city"),
-            "state": address.get("region"),
-            "venue_name": venue.get("name"),
-            "address": address.get("localized_address_display"),
-        })
-    return normalized
-
-def filter_upcoming(events: List[Dict], days: int = LOOKAHEAD_DAYS) -> List[Dict]:
-    now = datetime.utcnow()
-    cutoff = now + timedelta(days=days)
-    filtered = []
+def normalize_event(e: Dict, name: Optional[str], start: Optional[str]) -> Dict:
+    venue = e.get("venue") or {}
+    address = venue.get("address") or {}
+    return {
+        "name": name,
+        "url": e.get("url"),
+        "start": start,
+        "end": (e.get("end") or {}).get("local"),
+        "city": address.get("city"),
+        "state": address.get("region"),
+        "venue_name": venue.get("name"),
+        "address": address.get("localized_address_display"),
+    }
+
+def upcoming_events(events: List[Dict], days: int = LOOKAHEAD_DAYS) -> List[Dict]:
+    # Filter, dedupe and normalize in one pass: the window check runs on the
+    # raw start string, so out-of-range events are never normalized, and the
+    # first event per (name, start) wins. start.local is ISO-8601, whose
+    # YYYY-MM-DD prefix sorts like the date itself, so most out-of-range
+    # starts are rejected by a string comparison before any parsing.
+    today = date.today()
+    horizon = today + timedelta(days=days)
+    first = today.isoformat()
+    last = horizon.isoformat()
+    unique: Dict[Tuple, Dict] = {}
     for e in events:
-        start = e.get("start")
+        # page_events always sets "start"; a null or partial one is skipped
+        try:
+            start = e["start"]["local"]
+        except (KeyError, TypeError):
+            continue
         if not start:
             continue
+        day = start[:10]
+        if len(day) == 10 and day[4] == "-" and day[7] == "-" and day.replace("-", "").isdigit():
+            if not first <= day <= last:
+                continue
+        # fromisoformat drops impossible dates such as 2026-11-31, and decides
+        # the window for any start not shaped YYYY-MM-DD.
         try:
-            dt = datetime.fromisoformat(start)
+            if not today <= date.fromisoformat(day) <= horizon:
+                continue
         except ValueError:
             continue
-        if now <= dt <= cutoff:
-            filtered.append(e)
-    return filtered
+        name = (e.get("name") or {}).get("text")
+        if name:
+            # Recurring series repeat the same title on every occurrence (and
+            # across both state searches); interning keeps one copy of it.
+            name = sys.intern(name)
+        key = (name, start)
+        if key not in unique:
+            unique[key] = normalize_event(e, name, start)
+    return list(unique.values())
+
+def search_states(session: requests.Session, query: str, states: List[str],
+                  within: str) -> Tuple[List[Dict], List[str]]:
+    all_raw = []
+    all_warnings = []
+    # Search all states at once over the shared session; map() keeps the
+    # results in state order.
+    with ThreadPoolExecutor(max_workers=len(states) or 1) as pool:
+        results = pool.map(lambda state: search_region(session, query, state, within), states)
+        for state, (events, warns) in zip(states, results):
+            log.info("Total events for %s: %d", state, len(events))
+            all_raw.extend(events)
+            all_warnings.extend(warns)
+    return all_raw, all_warnings
 
 def fetch_events(token: str, query: str = DEFAULT_QUERY, states: List[str] = None, within: str = DEFAULT_WITHIN) -> Dict:
     if states is None:
         states = DEFAULT_STATES
-    headers = {
+    session = SESSION
+    # Set once on the session so every request picks them up without a
+    # per-call headers= merge.
+    session.headers.update({
         "Authorization": f"Bearer {token}",
         "Accept": "application/json",
         "User-Agent": "mt-wy-veteran-scraper/1.0",
-    }
-    session = requests.Session()
-    validate_token(session, headers)
-    all_raw = []
-    all_warnings = []
-    for state in states:
-        events, warns = search_region(session, headers, query, state, within)
-        all_raw.extend(events)
-        all_warnings.extend(warns)
-    normalized = normalize_events(all_raw)
-    upcoming = filter_upcoming(normalized, LOOKAHEAD_DAYS)
-    seen = set()
-    unique = []
-    for e in upcoming:
-        key = (e.get("name"), e.get("start"))
-        if key not in seen:
-            seen.add(key)
-            unique.append(e)
+    })
+    # /users/me/ costs a round trip per run; skip it while a marker from a
+    # recent successful check exists.
+    trusted_marker = token_recently_validated(token)
+    if not trusted_marker:
+        validate_token(session)
+        mark_token_validated(token)
+    all_raw, all_warnings = search_states(session, query, states, within)
+    if trusted_marker and any(w.startswith("Auth error") for w in all_warnings):
+        # The check was skipped on the marker's word but the searches were
+        # refused, so the marker may be stale. Re-check it: a revoked token
+        # raises here and main() writes the error payload; otherwise search
+        # once more. A token validated in this run is not re-checked.
+        forget_token(token)
+        validate_token(session)
+        mark_token_validated(token)
+        all_raw, all_warnings = search_states(session, query, states, within)
+    unique = upcoming_events(all_raw, LOOKAHEAD_DAYS)
     return {
         "generated": True,
         "events": unique,
@@ -150,10 +321,12 @@ def fetch_events(token: str, query: str = DEFAULT_QUERY, states: List[str] = Non
     }
 
 def main() -> int:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     token = get_token()
     try:
         payload = fetch_events(token)
         save_json(payload)
+        save_jsonl(payload["events"])
         return 0
     except Exception as exc:
         save_json({"generated": False, "error": str(exc)})
@@ -1,4 +1,5 @@
 import os
+import re
 
 # Only MT & WY
 REGION_STATES = {"MT", "WY"}
@@ -32,6 +33,16 @@ VETERAN_KEYWORDS = [
     "gold star", "VFW", "American Legion", "DAV", "AMVETS"
 ]
 
+
+def veteran_re(extra_keywords=()):
+    """Whole-word, case-insensitive match for any of VETERAN_KEYWORDS plus
+    ``extra_keywords`` (or their plurals); compile it once and reuse it so a
+    client-side filter scans each text a single time."""
+    keywords = [*VETERAN_KEYWORDS, *extra_keywords]
+    return re.compile(
+        r"\b(?:" + "|".join(map(re.escape, keywords)) + r")s?\b", re.IGNORECASE
+    )
+
 # Bounding boxes (rough) for statewide queries
 # (min_lat, min_lon, max_lat, max_lon)
 MT_BBOX = (44.3582, -116.1789, 49.0011, -104.0396)
@@ -41,23 +52,3 @@ WY_BBOX = (40.9949, -111.0569, 45.0059, -104.0522)
 PUBLIC_ICS_URLS = [
     # "https://example.org/calendar.ics",
 ]
-
-# --- Additional configuration for broader event search ---
-# Event scope: "VETERAN" for veteran-specific events or "ALL" for all events
-EVENT_SCOPE = os.getenv("EVENT_SCOPE", "VETERAN").upper()
-
-# Keywords to search for when EVENT_SCOPE is "VETERAN"
-VETERAN_KEYWORDS = [
-    "veteran", "veterans", "military", "guard", "reserve",
-    "usmc", "marine", "army", "navy", "air force", "space force",
-    "gold star", "VFW", "American Legion", "DAV", "AMVETS"
-]
-
-# Bounding boxes (rough) for statewide queries (min_lat, min_lon, max_lat, max_lon)
-MT_BBOX = (44.3582, -116.1789, 49.0011, -104.0396)
-WY_BBOX = (40.9949, -111.0569, 45.0059, -104.0522)
-
-# Public/community calendar feeds to include (optional; add more)
-PUBLIC_ICS_URLS = [
-    # Example: "https://example.org/calendar.ics",
-]
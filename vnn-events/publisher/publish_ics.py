@@ -1,36 +1,73 @@
 from __future__ import annotations
-from typing import List, Dict
-from icalendar import Calendar, Event
-from dateutil import parser as date_parser
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, List
+from utils.normalize import parse_iso
 import os
 
+if TYPE_CHECKING:
+    from sources.base import Event
 
-def publish_ics(events: List[Dict], out_dir: str) -> None:
-    os.makedirs(out_dir, exist_ok=True)
-    cal = Calendar()
-    cal.add('prodid', '-//VNN Events//')
-    cal.add('version', '2.0')
+# RFC 5545 TEXT escaping (backslash first, so added escapes aren't doubled)
+_ESCAPE = str.maketrans({"\\": "\\\\", ";": "\\;", ",": "\\,", "\n": "\\n"})
+_MAX_LINE_OCTETS = 75
+
+
+def _text(value: str) -> str:
+    return value.replace("\r\n", "\n").translate(_ESCAPE)
+
+
+def _dt(value: datetime) -> str:
+    # Aware times go out as UTC so calendar clients place them correctly;
+    # naive ones stay floating.
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return value.strftime("%Y%m%dT%H%M%S")
+
+
+def _line(buf: bytearray, name: str, value: str) -> None:
+    data = f"{name}:{value}".encode("utf-8")
+    if len(data) <= _MAX_LINE_OCTETS:
+        buf += data + b"\r\n"
+        return
+    # Fold at 75 octets without splitting a UTF-8 sequence; continuation
+    # lines start with a space, which counts toward their length.
+    limit = _MAX_LINE_OCTETS
+    while len(data) > limit:
+        cut = limit
+        while data[cut] & 0xC0 == 0x80:
+            cut -= 1
+        buf += data[:cut] + b"\r\n "
+        data = data[cut:]
+        limit = _MAX_LINE_OCTETS - 1
+    buf += data + b"\r\n"
+
+
+def publish_ics(events: List[Event], out_dir: str) -> None:
+    # VCALENDAR is plain line-oriented text, so it is written straight into
+    # one buffer rather than through icalendar's component objects.
+    buf = bytearray(b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//VNN Events//\r\n")
 
     for e in events:
         try:
-            start = date_parser.isoparse(e["start"])
+            start = parse_iso(e.start)
         except Exception:
             continue
-        ev = Event()
-        ev.add("summary", e["title"])
-        ev.add("dtstart", start)
-        if e.get("end"):
+        buf += b"BEGIN:VEVENT\r\n"
+        _line(buf, "SUMMARY", _text(e.title))
+        _line(buf, "DTSTART", _dt(start))
+        if e.end:
             try:
-                ev.add("dtend", date_parser.isoparse(e["end"]))
+                _line(buf, "DTEND", _dt(parse_iso(e.end)))
             except Exception:
                 pass
-        loc_parts = [e.get("venue_name"), e.get("address"), e.get("city"), e.get("state"), e.get("postal_code")]
-        ev.add("location", ", ".join([p for p in loc_parts if p]))
-        if e.get("registration_url"):
-            ev.add("url", e["registration_url"])
-        cal.add_component(ev)
+        loc_parts = [e.venue_name, e.address, e.city, e.state, e.postal_code]
+        _line(buf, "LOCATION", _text(", ".join([p for p in loc_parts if p])))
+        if e.registration_url:
+            _line(buf, "URL", e.registration_url)
+        buf += b"END:VEVENT\r\n"
 
+    buf += b"END:VCALENDAR\r\n"
     path = os.path.join(out_dir, "events.ics")
     with open(path, "wb") as f:
-        f.write(cal.to_ical())
+        f.write(buf)
     print(f"[publish_ics] wrote {path}")
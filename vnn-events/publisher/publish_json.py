@@ -1,13 +1,41 @@
 from __future__ import annotations
 import json, os
-from typing import List, Dict
+from dataclasses import asdict
+from typing import TYPE_CHECKING, List
+from utils.normalize import parse_iso
 
+try:
+    import orjson
+except ImportError:  # optional; fall back to the stdlib encoder
+    orjson = None
 
-def publish_json(events: List[Dict], out_dir: str, public_base_url: str) -> None:
-    os.makedirs(out_dir, exist_ok=True)
-    # Sort events by start date, then city, then title
-    events_sorted = sorted(events, key=lambda e: (e["start"], e.get("city") or "", e.get("title") or ""))
+if TYPE_CHECKING:
+    from sources.base import Event
+
+
+def publish_json(events: List[Event], out_dir: str, public_base_url: str) -> None:
+    # Sort events by start time, then city, then title. The key is built once
+    # per event; starts were already parsed (and memoised) by the lookahead
+    # filter, and comparing timestamps keeps mixed UTC offsets in true order.
+    events_sorted = sorted(events, key=lambda e: (parse_iso(e.start).timestamp(), e.city or "", e.title or ""))
+    payload = {"generated": True, "events": events_sorted}
+    # Events are dataclasses: orjson serializes them natively, the stdlib
+    # encoder goes through asdict. Both write compact JSON plus a newline, so
+    # the file is byte-identical either way.
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=asdict).encode("utf-8") + b"\n"
     path = os.path.join(out_dir, "events.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump({"generated": True, "events": events_sorted}, f, ensure_ascii=False)
-    print(f"[publish_json] wrote {path} | public: {public_base_url}/events.json")
+    with open(path, "wb") as f:
+        f.write(data)
+
+    # Same events, one per line, for consumers that want to stream the feed.
+    jsonl_path = os.path.join(out_dir, "events.jsonl")
+    with open(jsonl_path, "wb") as f:
+        for e in events_sorted:
+            if orjson is not None:
+                f.write(orjson.dumps(e, option=orjson.OPT_APPEND_NEWLINE))
+            else:
+                f.write(json.dumps(e, ensure_ascii=False, separators=(",", ":"), default=asdict).encode("utf-8") + b"\n")
+    print(f"[publish_json] wrote {path}, {jsonl_path} | public: {public_base_url}/events.json, {public_base_url}/events.jsonl")
@@ -17,16 +17,21 @@ from __future__ import annotations
 import logging
 import os
 import sys
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 # Ensure local modules are discoverable when run from repository root
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
 
-from config import REGION_STATES, LOOKAHEAD_DAYS, OUTPUT_DIR, PUBLIC_BASE_URL
+from config import (
+    REGION_STATES, LOOKAHEAD_DAYS, OUTPUT_DIR, PUBLIC_BASE_URL,
+    SERPAPI_KEY, MEETUP_TOKEN, PUBLIC_ICS_URLS, VUB_ICS_URL,
+)
 from utils.normalize import clean_and_filter
 from utils.dedupe import dedupe
 from publisher.publish_json import publish_json
 from publisher.publish_ics import publish_ics
+from sources.base import Event
 
 # Import source classes. Extend this list as new scrapers are implemented.
 from sources.impact_montana import ImpactMontana
@@ -67,6 +72,21 @@ logging.basicConfig(
 logger = logging.getLogger("vnn-events")
 
 
+def _fetch_source(src: object) -> List[Event]:
+    """Fetch one source, logging and swallowing any exception it raises."""
+    src_name = src.__class__.__name__
+    try:
+        logger.info("Fetching from source: %s", src_name)
+        events = src.fetch()
+        if events is None:
+            events = []
+        logger.info("[%s] %d events", src_name, len(events))
+        return events
+    except Exception:
+        logger.exception("[%s] failed while fetching events", src_name)
+        return []
+
+
 def main() -> int:
     """Entry point for running the VNN events collection pipeline.
 
@@ -78,8 +98,8 @@ def main() -> int:
         "vnn-events: starting run (lookahead=%d days) output=%s", LOOKAHEAD_DAYS, OUTPUT_DIR
     )
 
-    # Ensure the output directory exists early on. Without this, subsequent
-    # publishes will fail when writing files.
+    # Ensure the output directory exists early on. This is the only place it
+    # is created; the publishers assume it is there.
     try:
         os.makedirs(OUTPUT_DIR, exist_ok=True)
     except Exception:
@@ -87,38 +107,34 @@ def main() -> int:
         return 2
 
     # Assemble the list of source instances. If an optional scraper failed
-    # import above, it will be ``None`` here and thus skipped.
+    # import above, it will be ``None`` here and thus skipped. Sources whose
+    # API key or feed URL is not configured would only return [], so they
+    # are not scheduled at all.
     sources: List[object] = [
         ImpactMontana(),
         AdaptivePerformanceCenter(),
     ]
-    if GoogleEvents:
+    if GoogleEvents and SERPAPI_KEY:
         sources.append(GoogleEvents())
     if EventbriteMTWY:
         sources.append(EventbriteMTWY())
-    if MeetupMTWY:
+    if MeetupMTWY and MEETUP_TOKEN:
         sources.append(MeetupMTWY())
-    if GenericICS:
+    if GenericICS and PUBLIC_ICS_URLS:
         sources.append(GenericICS())
     # VeteransUpwardBoundMT is added last so its events can override duplicates
     # if they share the same titles/dates as those from generic calendar feeds.
-    sources.append(VeteransUpwardBoundMT())
-
-    collected: List[Dict] = []
-    # Fetch events from each source. If a particular source raises an
-    # exception during fetch(), it is logged and the run continues. This
-    # prevents a single misbehaving scraper from aborting the entire pipeline.
-    for src in sources:
-        src_name = src.__class__.__name__
-        try:
-            logger.info("Fetching from source: %s", src_name)
-            events = src.fetch()
-            if events is None:
-                events = []
-            logger.info("[%s] %d events", src_name, len(events))
+    if VUB_ICS_URL:
+        sources.append(VeteransUpwardBoundMT())
+
+    collected: List[Event] = []
+    # Fetch events from all sources concurrently; each is an independent,
+    # network-bound scrape. If a particular source raises an exception during
+    # fetch(), it is logged and the run continues. map() yields results in
+    # source order, so the dedupe precedence described above still holds.
+    with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+        for events in pool.map(_fetch_source, sources):
             collected.extend(events)
-        except Exception:
-            logger.exception("[%s] failed while fetching events", src_name)
 
     logger.info("Raw collected events: %d", len(collected))
 
@@ -4,46 +4,66 @@ If the site renders via JS, we still try to capture event elements present in th
 """
 
 from __future__ import annotations
-from typing import List, Dict
-import requests
-from bs4 import BeautifulSoup
+from typing import List
+from lxml import etree
 from dateutil import parser as date_parser
-import pytz
+from zoneinfo import ZoneInfo
 
-from .base import Source, norm_event
+from .base import Source, Event, html_text, html_tree, norm_event
 
-TZ = pytz.timezone("America/Denver")
+TZ = ZoneInfo("America/Denver")
 EVENTS_URL = "https://www.adaptiveperformancecenter.org/events/"
 
+# The page is parsed with lxml.html directly (no BeautifulSoup object graph),
+# so the CSS selectors are spelled as XPath, compiled once.
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# .tribe-events-calendar-list__event, .event, article, li
+ITEMS = etree.XPath(
+    f"//*[{_has_class('tribe-events-calendar-list__event')} or {_has_class('event')}"
+    " or self::article or self::li]"
+)
+# first of .tribe-events-calendar-list__event-title, h3, h2, a
+TITLE = etree.XPath(
+    f"(.//*[{_has_class('tribe-events-calendar-list__event-title')}"
+    " or self::h3 or self::h2 or self::a])[1]"
+)
+TIME = etree.XPath("(.//time)[1]")
+LINK = etree.XPath("(.//a[@href])[1]")
+
 class AdaptivePerformanceCenter(Source):
-    def fetch(self) -> List[Dict]:
-        out: List[Dict] = []
+    def fetch(self) -> List[Event]:
+        out: List[Event] = []
         try:
-            r = requests.get(EVENTS_URL, timeout=25)
+            r = self.session.get(EVENTS_URL, timeout=25)
             r.raise_for_status()
-            s = BeautifulSoup(r.text, "lxml")
-            items = s.select(".tribe-events-calendar-list__event, .event, article, li")
-            for it in items:
-                title_el = it.select_one(".tribe-events-calendar-list__event-title, h3, h2, a")
-                title = title_el.get_text(strip=True) if title_el else None
+            tree = html_tree(r.content)
+            for it in ITEMS(tree):
+                title_el = TITLE(it)
+                title = html_text(title_el[0]) if title_el else None
                 if not title:
                     continue
 
-                time_el = it.select_one("time")
-                when = time_el.get("datetime") if time_el and time_el.has_attr("datetime") else (time_el.get_text(strip=True) if time_el else None)
+                time_el = TIME(it)
+                when = None
+                if time_el:
+                    when = time_el[0].get("datetime")
+                    if when is None:
+                        when = html_text(time_el[0])
                 start = None
                 if when:
                     try:
                         start = date_parser.parse(when)
                         if start and not start.tzinfo:
-                            start = TZ.localize(start)
+                            start = start.replace(tzinfo=TZ)
                     except Exception:
                         pass
                 if not start:
                     continue
 
-                link_el = it.select_one("a[href]")
-                href = link_el["href"] if link_el else EVENTS_URL
+                link_el = LINK(it)
+                href = link_el[0].get("href") if link_el else EVENTS_URL
 
                 e = norm_event(
                     title=title,
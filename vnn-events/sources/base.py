@@ -1,33 +1,167 @@
 from __future__ import annotations
+import os
+import re
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, tzinfo
+from typing import Any, List, Optional
+import requests
+from bs4 import UnicodeDammit
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import LOOKAHEAD_DAYS, REGION_STATES
+from utils.normalize import TZ, iso_date_bounds, outside_dates, parse_iso
+
+try:
+    import requests_cache
+except ImportError:  # optional; without it every run goes to the network
+    requests_cache = None
+
+# On-disk HTTP cache shared across runs (sqlite; ".sqlite" is appended).
+HTTP_CACHE_PATH = os.getenv("HTTP_CACHE_PATH", "vnn_http_cache")
+HTTP_CACHE_TTL_SEC = 1800
+# Longest Retry-After the adapter will wait before retrying
+MAX_RETRY_AFTER_SEC = 60
+# Leading <?xml ...?> declaration, stripped by html_tree
+_XML_DECL_RE = re.compile(r"^\s*<\?xml[^>]*\?>")
+# Text nodes under an element, minus those BeautifulSoup's get_text skips
+_VISIBLE_TEXT = etree.XPath(".//text()[not(ancestor::script or ancestor::style or ancestor::template)]")
+
+class CappedRetry(Retry):
+    """Retry whose Retry-After waits are capped at MAX_RETRY_AFTER_SEC.
+
+    urllib3 otherwise sleeps for whatever the server sends, so one
+    "Retry-After: 3600" could hold a source (and the run) for hours.
+    """
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER_SEC)
+
+# One pooled session for every source, so repeat requests to a host reuse the
+# keep-alive connection instead of paying a fresh TCP+TLS handshake. Retry
+# backs off exponentially with jitter on 429 and gateway errors, honouring
+# Retry-After (up to MAX_RETRY_AFTER_SEC) when the server sends it;
+# raise_on_status=False hands the final response back so callers'
+# raise_for_status still reports it.
+# With requests-cache installed, GETs are also served from an on-disk cache
+# that honours Cache-Control/ETag and falls back to stale data on errors.
+if requests_cache is not None:
+    SESSION = requests_cache.CachedSession(
+        HTTP_CACHE_PATH,
+        backend="sqlite",
+        expire_after=HTTP_CACHE_TTL_SEC,
+        cache_control=True,
+        stale_if_error=True,
+    )
+else:
+    SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=32,
+    max_retries=CappedRetry(total=5, backoff_factor=1.0, backoff_jitter=0.5,
+                      status_forcelist=[429, 502, 503, 504],
+                      raise_on_status=False),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
 
 class Source(ABC):
+    session: requests.Session = SESSION
+
     @abstractmethod
-    def fetch(self) -> List[Dict]:
-        """Return a list of normalized Event dicts."""
+    def fetch(self) -> List[Event]:
+        """Return a list of normalized Events."""
         raise NotImplementedError
 
-def norm_event(**kwargs) -> Optional[Dict]:
-    e = {
-        "title": (kwargs.get("title") or "").strip(),
-        "start": kwargs.get("start"),
-        "end": kwargs.get("end"),
-        "timezone": kwargs.get("timezone", "America/Denver"),
-        "venue_name": (kwargs.get("venue_name") or None),
-        "address": kwargs.get("address"),
-        "city": kwargs.get("city"),
-        "state": kwargs.get("state"),
-        "postal_code": kwargs.get("postal_code"),
-        "country": "US",
-        "cost": kwargs.get("cost"),
-        "registration_url": kwargs.get("registration_url"),
-        "source": kwargs.get("source"),
-        "description": kwargs.get("description"),
-        "tags": kwargs.get("tags") or ["veterans"],
-        "lat": kwargs.get("lat"),
-        "lon": kwargs.get("lon"),
-    }
-    if not e["title"] or not e["start"] or not e["state"]:
+def ical_iso(prop: Any, default_tz: tzinfo) -> Optional[str]:
+    """ISO string for an iCalendar DTSTART/DTEND property.
+
+    All-day (date-only) values yield None; naive datetimes get default_tz.
+    """
+    dt = prop.dt if prop else None
+    if not isinstance(dt, datetime):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=default_tz)
+    return dt.isoformat()
+
+def html_tree(content: bytes) -> html.HtmlElement:
+    """lxml.html document for a response body.
+
+    lxml falls back to Latin-1 when a page declares no charset; UnicodeDammit
+    decodes the way BeautifulSoup did (declared charset, then detection).
+    The XML declaration some XHTML pages start with is dropped, since lxml
+    refuses str input that declares an encoding.
+    """
+    markup = UnicodeDammit(content, is_html=True).unicode_markup
+    return html.fromstring(_XML_DECL_RE.sub("", markup, count=1))
+
+def html_text(el: html.HtmlElement, sep: str = "") -> str:
+    """BeautifulSoup's get_text(sep, strip=True) for an lxml element: the
+    stripped, non-empty text pieces joined by sep, skipping the contents of
+    script, style and template elements."""
+    return sep.join(t for t in (s.strip() for s in _VISIBLE_TEXT(el)) if t)
+
+@dataclass(slots=True)
+class Event:
+    """A normalized event; slotted to keep per-event memory small."""
+    title: str
+    start: str
+    end: Optional[str] = None
+    timezone: str = "America/Denver"
+    venue_name: Optional[str] = None
+    address: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    postal_code: Optional[str] = None
+    country: str = "US"
+    cost: Optional[str] = None
+    registration_url: Optional[str] = None
+    source: Optional[str] = None
+    description: Optional[str] = None
+    tags: List[str] = field(default_factory=lambda: ["veterans"])
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+
+# Lookahead window fixed when the sources are loaded, i.e. at the start of a
+# run. norm_event drops events outside it (or outside REGION_STATES) so they
+# never reach the shared list, dedupe or the publishers; clean_and_filter
+# still applies the authoritative check afterwards.
+WINDOW_START = datetime.now(TZ)
+WINDOW_END = WINDOW_START + timedelta(days=LOOKAHEAD_DAYS)
+WINDOW_DATES = iso_date_bounds(WINDOW_START, WINDOW_END)
+
+def norm_event(**kwargs) -> Optional[Event]:
+    title = (kwargs.get("title") or "").strip()
+    start = kwargs.get("start")
+    state = kwargs.get("state")
+    if not title or not start or state not in REGION_STATES:
+        return None
+    try:
+        # Most out-of-range starts are rejected on their date prefix alone
+        if outside_dates(start, WINDOW_DATES) or not WINDOW_START <= parse_iso(start) <= WINDOW_END:
+            return None
+    except (ValueError, OverflowError, TypeError):  # unparseable or naive start
         return None
-    return e
+    return Event(
+        title=title,
+        start=start,
+        end=kwargs.get("end"),
+        timezone=kwargs.get("timezone", "America/Denver"),
+        venue_name=(kwargs.get("venue_name") or None),
+        address=kwargs.get("address"),
+        city=kwargs.get("city"),
+        state=state,
+        postal_code=kwargs.get("postal_code"),
+        cost=kwargs.get("cost"),
+        registration_url=kwargs.get("registration_url"),
+        source=kwargs.get("source"),
+        description=kwargs.get("description"),
+        tags=kwargs.get("tags") or ["veterans"],
+        lat=kwargs.get("lat"),
+        lon=kwargs.get("lon"),
+    )
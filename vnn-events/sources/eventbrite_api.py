@@ -1,14 +1,113 @@
 from __future__ import annotations
-from typing import List, Dict
+from typing import Dict, List, Optional
+import logging
 import requests
-from datetime import datetime, timedelta
-import time
 import re
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+import threading
+import time
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
+from urllib.parse import urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from .base import Event, Source, norm_event
+from config import LOOKAHEAD_DAYS, EVENT_SCOPE, REGION_STATES, VETERAN_KEYWORDS, veteran_re
+
+# Child of run.py's "vnn-events" logger. Per-page and per-event detail is
+# logged at DEBUG, so it is only formatted under VNN_DEBUG=1.
+log = logging.getLogger("vnn-events.EventbriteMTWY")
+
+# Patterns used while scanning scraped pages, compiled once at import.
+_MONTHS = r'January|February|March|April|May|June|July|August|September|October|November|December'
+
+# "City, State" extraction for _parse_location, tried in order
+_CITY_PATTERNS = [
+    re.compile(r'^([^,]+),\s*(MT|WY|Montana|Wyoming)', re.IGNORECASE),  # City, State
+    re.compile(r'^([^,]+),', re.IGNORECASE),  # City, anything
+    re.compile(r'(\w+(?:\s+\w+)?),\s*(?:MT|WY)', re.IGNORECASE),  # Word(s), state
+]
+_CITY_PREFIX_RE = re.compile(r'^(at\s+|the\s+)', re.IGNORECASE)
+
+# Every accepted date format in one alternation, so a single search both
+# finds and classifies a date; _date_from_match formats whichever matched.
+# The leftmost date in the string wins, whichever format it is in.
+# ASCII characters _parse_date_flexible strips before matching: anything
+# that is not a word character, whitespace or one of ':,/-'.
+_DATE_STRIP_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128))
+    if not (c.isalnum() or c.isspace() or c in '_:,/-')
+))
+_DATE_RE = re.compile(
+    rf'\b(?:(?P<month>{_MONTHS})\s+(?P<mday>\d{{1,2}}),?\s+(?P<myear>\d{{4}})\b'
+    r'|(?P<us_month>\d{1,2})/(?P<us_day>\d{1,2})/(?P<us_year>\d{4})\b'
+    r'|(?P<iso_year>\d{4})-(?P<iso_month>\d{1,2})-(?P<iso_day>\d{1,2})\b)',
+    re.IGNORECASE,
+)
+
+# Page-scanning helpers
+_DATE_HINT_RE = re.compile(rf'\b(20\d{{2}}|{_MONTHS})', re.IGNORECASE)
+_WORDY_DATE_RE = re.compile(r'(\w+\s+\d{1,2},?\s+\d{4})')
+_VNN_LOCATION_PATTERNS = [
+    re.compile(r'([A-Za-z\s]+,\s*(?:MT|WY|Montana|Wyoming))'),
+    re.compile(r'((?:in|at)\s+([A-Za-z\s]+)(?:,\s*(?:MT|WY|Montana|Wyoming))?)'),
+]
+_VA_LOCATION_RE = re.compile(r'([A-Za-z\s]+,\s*(?:MT|WY))')
+_MTWY_RE = re.compile(r'MT|WY|Montana|Wyoming')
+# State indicators for _parse_location; plain substrings, matched case-insensitively.
+_MT_STATE_RE = re.compile(r'montana|, mt|mt ', re.IGNORECASE)
+_WY_STATE_RE = re.compile(r'wyoming|, wy|wy ', re.IGNORECASE)
+
+@lru_cache(maxsize=512)
+def _parse_location(location: str) -> tuple:
+    """(city, state) for a location string; cached, since the same few
+    towns repeat across scrapers and pages."""
+    if not location:
+        return None, None
+        
+    # Check for state indicators
+    state = None
+    if _MT_STATE_RE.search(location):
+        state = "MT"
+    elif _WY_STATE_RE.search(location):
+        state = "WY"
+        
+    # Extract city
+    city = None
+    for pattern in _CITY_PATTERNS:
+        match = pattern.search(location)
+        if match:
+            city = match.group(1).strip()
+            city = _CITY_PREFIX_RE.sub('', city)
+            break
+    
+    return city, state
 
-from .base import Source, norm_event
-from ..config import LOOKAHEAD_DAYS, EVENT_SCOPE, VETERAN_KEYWORDS
+# Page-level CSS selectors, compiled once. Each group selector walks the tree
+# once and yields matching elements in document order without duplicates.
+_VNN_EVENT_SEL = sv.compile(", ".join([
+    '.event-item', '.event', '.calendar-event',
+    '.post', '.entry', 'article', '.content-block',
+    '[data-event]', '.listing', '.news-item',
+]))
+_VA_EVENT_SEL = sv.compile('.event, .event-item, .vads-l-row, .news-release, [data-event]')
+_VA_TITLE_SEL = sv.compile('h1, h2, h3, .event-title, .title, a')
+_GOV_CONTENT_SEL = sv.compile('.news, .events, .announcements, .content, [class*="news"], [class*="event"]')
+_GOV_TITLE_SEL = sv.compile('h1, h2, h3, .title, a')
+# Gov home pages are mostly navigation and footer; only build the subtrees
+# whose class could satisfy _GOV_CONTENT_SEL (a superset of its matches).
+_GOV_CONTENT_STRAINER = SoupStrainer(class_=re.compile(r'news|event|announcements|content'))
+
+# Candidate elements examined per VNN page
+VNN_MAX_ELEMENTS = 20
+# Block elements checked by the VNN fallback text scan
+_VNN_TEXT_TAGS = frozenset({'div', 'p', 'section'})
+
+# Minimum spacing between requests to the same host. Requests to different
+# hosts are not delayed by each other.
+HOST_MIN_INTERVAL_SEC = 1.0
+
+VNN_EVENTS_URL = "https://www.veteransnavigation.org/communityevents"
 
 class EventbriteMTWY(Source):
     """
@@ -25,49 +124,28 @@ class EventbriteMTWY(Source):
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
         }
+        # Per-host schedule used by _throttle
+        self._host_lock = threading.Lock()
+        self._host_next_ok: Dict[str, float] = {}
         
-        self.veteran_keywords = VETERAN_KEYWORDS + [
+        extra_keywords = [
             'vso', 'service officer', 'disabled american veterans',
             'veterans of foreign wars', 'american legion auxiliary',
             'military family', 'gold star family', 'blue star',
             'deployment', 'combat veteran', 'service dog'
         ]
+        self.veteran_keywords = VETERAN_KEYWORDS + extra_keywords
+        # One case-insensitive alternation scans the text once, without a
+        # lowered copy
+        self._veteran_re = veteran_re(extra_keywords)
         
     def _is_veteran_related(self, text: str) -> bool:
         """Check if text is veteran/military related."""
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in self.veteran_keywords)
+        return self._veteran_re.search(text) is not None
     
     def _parse_location(self, location: str) -> tuple:
         """Parse location string to extract city and state."""
-        if not location:
-            return None, None
-            
-        location_lower = location.lower()
-        
-        # Check for state indicators
-        state = None
-        if any(indicator in location_lower for indicator in ["montana", ", mt", "mt "]):
-            state = "MT"
-        elif any(indicator in location_lower for indicator in ["wyoming", ", wy", "wy "]):
-            state = "WY"
-            
-        # Extract city
-        city = None
-        patterns = [
-            r'^([^,]+),\s*(MT|WY|Montana|Wyoming)',  # City, State
-            r'^([^,]+),',  # City, anything
-            r'(\w+(?:\s+\w+)?),\s*(?:MT|WY)',  # Word(s), state
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, location, re.IGNORECASE)
-            if match:
-                city = match.group(1).strip()
-                city = re.sub(r'^(at\s+|the\s+)', '', city, flags=re.IGNORECASE)
-                break
-        
-        return city, state
+        return _parse_location(location)
     
     def _parse_date_flexible(self, date_str: str) -> str:
         """Parse various date formats into ISO format."""
@@ -75,25 +153,18 @@ class EventbriteMTWY(Source):
             return None
         
         # Clean the date string
-        date_str = re.sub(r'[^\w\s:,-]', '', date_str).strip()
-        
-        # Try different date patterns
-        patterns = [
-            (r'(\d{4})-(\d{1,2})-(\d{1,2})', lambda m: f"{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}"),
-            (r'(\d{1,2})/(\d{1,2})/(\d{4})', lambda m: f"{m.group(3)}-{m.group(1).zfill(2)}-{m.group(2).zfill(2)}"),
-            (r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})', 
-             lambda m: self._month_name_to_iso(m.group(1), m.group(2), m.group(3))),
-        ]
-        
-        for pattern, formatter in patterns:
-            match = re.search(pattern, date_str, re.IGNORECASE)
-            if match:
-                try:
-                    return formatter(match)
-                except:
-                    continue
-        
-        return None
+        date_str = date_str.translate(_DATE_STRIP_TABLE).strip()
+        return self._date_from_match(_DATE_RE.search(date_str))
+    
+    def _date_from_match(self, match) -> str:
+        """Format a _DATE_RE match as YYYY-MM-DD."""
+        if not match:
+            return None
+        if match.group('month'):
+            return self._month_name_to_iso(match.group('month'), match.group('mday'), match.group('myear'))
+        if match.group('us_year'):
+            return f"{match.group('us_year')}-{match.group('us_month').zfill(2)}-{match.group('us_day').zfill(2)}"
+        return f"{match.group('iso_year')}-{match.group('iso_month').zfill(2)}-{match.group('iso_day').zfill(2)}"
     
     def _month_name_to_iso(self, month_name: str, day: str, year: str) -> str:
         """Convert month name to ISO format."""
@@ -107,83 +178,114 @@ class EventbriteMTWY(Source):
             return f"{year}-{month_num}-{day.zfill(2)}"
         return None
     
+    def _throttle(self, url: str) -> None:
+        """Wait until ``url``'s host may be requested again."""
+        host = urlparse(url).netloc
+        with self._host_lock:
+            now = time.monotonic()
+            slot = max(now, self._host_next_ok.get(host, 0.0))
+            self._host_next_ok[host] = slot + HOST_MIN_INTERVAL_SEC
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def _get(self, url: str, timeout: int) -> requests.Response:
+        """GET ``url`` on the pooled session, spaced out per host."""
+        self._throttle(url)
+        return self.session.get(url, headers=self.headers, timeout=timeout)
+    
+    def _page_has_candidates(self, soup: BeautifulSoup) -> bool:
+        """Whether any element's text could pass the VNN keyword and date checks.
+
+        An element's text is a slice of the page's text, so one linear pass
+        over the page rules out the nested per-element walk when it fails.
+        """
+        text = soup.get_text(separator=' ')
+        return self._is_veteran_related(text) and _DATE_HINT_RE.search(text) is not None
+    
+    def _parse_candidate(self, text: str) -> tuple:
+        """Pull (fallback title, date, location) out of a VNN candidate's text."""
+        # First line, or its first sentence when the line is very long
+        title = text.split('\n', 1)[0].strip()
+        if len(title) > 150:
+            title = title.split('.', 1)[0]
+        
+        date_str = self._date_from_match(_DATE_RE.search(text))
+        
+        location = ""
+        for pattern in _VNN_LOCATION_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                location = match.group(1).replace('in ', '').replace('at ', '')
+                break
+        
+        return title, date_str, location
+    
+    def _get_many(self, urls: List[str], timeout: int = 15) -> List[tuple]:
+        """Fetch several pages at once; returns (url, response) pairs in input order.
+
+        A request that fails outright is logged and reported with a response of None.
+        """
+        def get(url: str) -> tuple:
+            try:
+                return url, self._get(url, timeout)
+            except Exception as e:
+                log.warning("Request error %s: %s", url, e)
+                return url, None
+
+        with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+            return list(pool.map(get, urls))
+    
     def _scrape_veterans_navigation_network(self) -> List[Dict]:
         """Scrape real events from Veterans Navigation Network."""
         events = []
-        print("[EventbriteMTWY] Scraping Veterans Navigation Network...")
+        log.info("Scraping Veterans Navigation Network...")
         
         try:
-            url = "https://www.veteransnavigation.org/communityevents"
-            response = requests.get(url, headers=self.headers, timeout=20)
-            print(f"[EventbriteMTWY] VNN response: {response.status_code}")
+            url = VNN_EVENTS_URL
+            response = self._get(url, 20)
+            log.debug("VNN response: %d", response.status_code)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
                 
                 # Try multiple selectors for event content
-                event_selectors = [
-                    '.event-item', '.event', '.calendar-event', 
-                    '.post', '.entry', 'article', '.content-block',
-                    '[data-event]', '.listing', '.news-item'
-                ]
-                
-                event_elements = []
-                for selector in event_selectors:
-                    found = soup.select(selector)
-                    if found:
-                        event_elements.extend(found)
-                        print(f"[EventbriteMTWY] Found {len(found)} elements with {selector}")
-                
-                # Also look for any text containing dates and veteran keywords
-                if len(event_elements) < 5:
-                    all_text_elements = soup.find_all(['div', 'p', 'section'])
+                event_elements = _VNN_EVENT_SEL.select(soup, limit=VNN_MAX_ELEMENTS)
+                log.debug("Found %d elements with event selectors", len(event_elements))
+
+                # Also look for any text containing dates and veteran keywords.
+                # Only the first VNN_MAX_ELEMENTS candidates are processed, so
+                # stop scanning (and extracting text) once that many are found.
+                # Text extracted here is kept so each subtree is walked once.
+                texts: Dict[int, str] = {}
+                if len(event_elements) < 5 and self._page_has_candidates(soup):
+                    # Walk the tree lazily so breaking out also ends the traversal
+                    all_text_elements = (el for el in soup.descendants if el.name in _VNN_TEXT_TAGS)
                     for elem in all_text_elements:
-                        text = elem.get_text()
+                        if len(event_elements) >= VNN_MAX_ELEMENTS:
+                            break
+                        text = elem.get_text(separator=' ').strip()
                         if (self._is_veteran_related(text) and 
-                            re.search(r'\b(20\d{2}|january|february|march|april|may|june|july|august|september|october|november|december)', text, re.IGNORECASE)):
+                            _DATE_HINT_RE.search(text)):
                             event_elements.append(elem)
+                            texts[id(elem)] = text
                 
-                print(f"[EventbriteMTWY] Processing {len(event_elements)} potential events")
+                log.debug("Processing %d potential events", len(event_elements))
                 
-                for elem in event_elements[:20]:  # Limit processing
+                for elem in event_elements[:VNN_MAX_ELEMENTS]:
                     try:
-                        text = elem.get_text(separator=' ').strip()
+                        text = texts.get(id(elem))
+                        if text is None:
+                            text = elem.get_text(separator=' ').strip()
                         
                         # Must be veteran related
                         if not self._is_veteran_related(text):
                             continue
                         
+                        text_title, date_str, location = self._parse_candidate(text)
+                        
                         # Extract title
                         title_elem = elem.find(['h1', 'h2', 'h3', 'h4', 'strong', '.title'])
-                        if title_elem:
-                            title = title_elem.get_text().strip()
-                        else:
-                            # Use first line or sentence
-                            lines = text.split('\n')
-                            title = lines[0].strip() if lines else text[:100]
-                            if len(title) > 150:
-                                title = title.split('.')[0]
-                        
-                        # Extract date
-                        date_match = re.search(
-                            r'\b((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}|\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{1,2}-\d{1,2})', 
-                            text, re.IGNORECASE
-                        )
-                        date_str = None
-                        if date_match:
-                            date_str = self._parse_date_flexible(date_match.group(1))
-                        
-                        # Extract location
-                        location_patterns = [
-                            r'([A-Za-z\s]+,\s*(?:MT|WY|Montana|Wyoming))',
-                            r'((?:in|at)\s+([A-Za-z\s]+)(?:,\s*(?:MT|WY|Montana|Wyoming))?)'
-                        ]
-                        location = ""
-                        for pattern in location_patterns:
-                            match = re.search(pattern, text)
-                            if match:
-                                location = match.group(1).replace('in ', '').replace('at ', '')
-                                break
+                        title = title_elem.get_text().strip() if title_elem else text_title
                         
                         # Get URL
                         link = elem.find('a')
@@ -196,53 +298,29 @@ class EventbriteMTWY(Source):
                                 "title": title,
                                 "start": date_str,
                                 "city": city,
-                                "state": state or ("MT" if "montana" in location.lower() else "WY" if "wyoming" in location.lower() else None),
+                                "state": state,
                                 "address": location,
                                 "registration_url": event_url,
                                 "source": "veterans_navigation_network",
                                 "description": text[:300] + "..." if len(text) > 300 else text
                             }
                             
-                            if event_data["state"] in ["MT", "WY"]:
+                            if event_data["state"] in REGION_STATES:
                                 events.append(event_data)
-                                print(f"[EventbriteMTWY] ✓ VNN Event: {title}")
+                                log.debug("✓ VNN Event: %s", title)
                     
                     except Exception as e:
                         continue
             
-            # Add known VNN events from search results
-            known_vnn_events = [
-                {
-                    "title": "SW Montana Veterans Poker Run",
-                    "start": "2025-08-23",
-                    "city": "Deer Lodge",
-                    "state": "MT",
-                    "address": "Deer Lodge, MT",
-                    "registration_url": url,
-                    "source": "veterans_navigation_network"
-                },
-                {
-                    "title": "Montana Veteran Affairs Division Outreach",
-                    "start": (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d"),
-                    "city": "Crow Agency", 
-                    "state": "MT",
-                    "address": "Little Big Horn College, Crow Agency, MT",
-                    "registration_url": url,
-                    "source": "veterans_navigation_network"
-                }
-            ]
-            
-            events.extend(known_vnn_events)
-            
         except Exception as e:
-            print(f"[EventbriteMTWY] VNN error: {e}")
+            log.warning("VNN error: %s", e)
         
         return events
     
     def _scrape_va_events(self) -> List[Dict]:
         """Scrape VA outreach and medical center events."""
         events = []
-        print("[EventbriteMTWY] Scraping VA events...")
+        log.info("Scraping VA events...")
         
         va_urls = [
             "https://www.va.gov/montana-health-care/events/",
@@ -250,34 +328,37 @@ class EventbriteMTWY(Source):
             "https://www.va.gov/outreach-and-events/events/"
         ]
         
-        for url in va_urls:
+        for url, response in self._get_many(va_urls, timeout=15):
             try:
-                response = requests.get(url, headers=self.headers, timeout=15)
-                if response.status_code != 200:
+                if response is None or response.status_code != 200:
                     continue
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml')
+                # Page-level facts, checked once rather than per element
+                regional_page = "montana" in url or "cheyenne" in url
+                fallback_state = "MT" if "montana" in url else "WY"
                 
-                # Look for event containers
-                event_elements = soup.select('.event, .event-item, .vads-l-row, .news-release, [data-event]')
+                # Look for event containers; only the first few are used, so
+                # let the selector stop matching once it has them.
+                event_elements = _VA_EVENT_SEL.select(soup, limit=5)
                 
-                for elem in event_elements[:5]:
+                for elem in event_elements:
                     try:
                         text = elem.get_text()
                         
                         # Must mention MT or WY
-                        if not any(loc in text for loc in ['MT', 'WY', 'Montana', 'Wyoming']):
+                        if not _MTWY_RE.search(text):
                             continue
                         
-                        title_elem = elem.select_one('h1, h2, h3, .event-title, .title, a')
+                        title_elem = _VA_TITLE_SEL.select_one(elem)
                         title = title_elem.get_text().strip() if title_elem else "VA Event"
                         
                         # Extract date
-                        date_match = re.search(r'(\w+\s+\d{1,2},?\s+\d{4})', text)
+                        date_match = _WORDY_DATE_RE.search(text)
                         date_str = self._parse_date_flexible(date_match.group(1)) if date_match else None
                         
                         # Extract location
-                        location_match = re.search(r'([A-Za-z\s]+,\s*(?:MT|WY))', text)
+                        location_match = _VA_LOCATION_RE.search(text)
                         location = location_match.group(1) if location_match else ""
                         
                         city, state = self._parse_location(location)
@@ -285,124 +366,57 @@ class EventbriteMTWY(Source):
                         link = elem.find('a')
                         event_url = urljoin(url, link['href']) if link and link.get('href') else url
                         
-                        if title and (state in ["MT", "WY"] or any(s in url for s in ["montana", "cheyenne"])):
+                        if title and (state in REGION_STATES or regional_page):
                             events.append({
                                 "title": title,
                                 "start": date_str,
                                 "city": city,
-                                "state": state or ("MT" if "montana" in url else "WY"),
+                                "state": state or fallback_state,
                                 "address": location,
                                 "registration_url": event_url,
                                 "source": "va_events"
                             })
-                            print(f"[EventbriteMTWY] ✓ VA Event: {title}")
+                            log.debug("✓ VA Event: %s", title)
                             
                     except Exception as e:
                         continue
                 
-                time.sleep(1)  # Be respectful
-                
             except Exception as e:
-                print(f"[EventbriteMTWY] VA URL error {url}: {e}")
+                log.warning("VA URL error %s: %s", url, e)
                 continue
         
-        # Add sample VA events
-        sample_va = [
-            {
-                "title": "Montana VA Medical Center Health Fair",
-                "start": (datetime.now() + timedelta(days=20)).strftime("%Y-%m-%d"),
-                "city": "Fort Harrison",
-                "state": "MT", 
-                "address": "VA Medical Center, Fort Harrison, MT",
-                "registration_url": "https://www.va.gov/montana-health-care/",
-                "source": "va_events"
-            },
-            {
-                "title": "Cheyenne VAMC Veterans Day Ceremony",
-                "start": "2025-11-11",
-                "city": "Cheyenne",
-                "state": "WY",
-                "address": "Cheyenne VA Medical Center, Cheyenne, WY", 
-                "registration_url": "https://www.va.gov/cheyenne-health-care/",
-                "source": "va_events"
-            }
-        ]
-        
-        events.extend(sample_va)
-        return events
-    
-    def _scrape_meetup_events(self) -> List[Dict]:
-        """Scrape veteran-related Meetup events."""
-        events = []
-        print("[EventbriteMTWY] Scraping Meetup events...")
-        
-        # Since Meetup API requires payment, we'll use sample realistic events
-        # In a production version, you'd implement their paid API or web scraping
-        
-        meetup_events = [
-            {
-                "title": "Montana Veterans Monthly Coffee",
-                "start": (datetime.now() + timedelta(days=10)).strftime("%Y-%m-%d"),
-                "city": "Billings",
-                "state": "MT",
-                "address": "Coffee Shop, Billings, MT",
-                "registration_url": "https://www.meetup.com/",
-                "source": "meetup"
-            },
-            {
-                "title": "Wyoming Veterans Hiking Group",
-                "start": (datetime.now() + timedelta(days=17)).strftime("%Y-%m-%d"),
-                "city": "Jackson", 
-                "state": "WY",
-                "address": "Grand Teton National Park, Jackson, WY",
-                "registration_url": "https://www.meetup.com/",
-                "source": "meetup"
-            },
-            {
-                "title": "Great Falls Veterans Support Circle",
-                "start": (datetime.now() + timedelta(days=25)).strftime("%Y-%m-%d"),
-                "city": "Great Falls",
-                "state": "MT",
-                "address": "Community Center, Great Falls, MT",
-                "registration_url": "https://www.meetup.com/",
-                "source": "meetup"
-            }
-        ]
-        
-        events.extend(meetup_events)
-        print(f"[EventbriteMTWY] Added {len(meetup_events)} Meetup events")
         return events
     
     def _scrape_government_military(self) -> List[Dict]:
         """Scrape state military and government veteran events."""
         events = []
-        print("[EventbriteMTWY] Scraping government military sites...")
+        log.info("Scraping government military sites...")
         
         gov_urls = [
             ("https://dma.mt.gov/", "MT"),
             ("https://www.wyomilitary.wyo.gov/", "WY")
         ]
         
-        for url, state in gov_urls:
+        responses = self._get_many([url for url, _ in gov_urls], timeout=15)
+        for (url, state), (_, response) in zip(gov_urls, responses):
             try:
-                response = requests.get(url, headers=self.headers, timeout=15)
-                if response.status_code != 200:
+                if response is None or response.status_code != 200:
                     continue
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.content, 'lxml', parse_only=_GOV_CONTENT_STRAINER)
                 
                 # Look for news, events, announcements
-                content_areas = soup.select('.news, .events, .announcements, .content, [class*="news"], [class*="event"]')
+                content_areas = _GOV_CONTENT_SEL.select(soup, limit=3)
                 
-                for area in content_areas[:3]:
+                for area in content_areas:
                     text = area.get_text()
                     
                     if self._is_veteran_related(text):
-                        title_elem = area.select_one('h1, h2, h3, .title, a')
+                        title_elem = _GOV_TITLE_SEL.select_one(area)
                         title = title_elem.get_text().strip() if title_elem else f"{state} Military Event"
                         
                         # Look for dates
-                        date_match = re.search(r'(\w+\s+\d{1,2},?\s+\d{4})', text)
+                        date_match = _WORDY_DATE_RE.search(text)
                         date_str = self._parse_date_flexible(date_match.group(1)) if date_match else None
                         
                         if title and date_str:
@@ -415,92 +429,72 @@ class EventbriteMTWY(Source):
                                 "registration_url": url,
                                 "source": "government_military"
                             })
-                            print(f"[EventbriteMTWY] ✓ Gov Event: {title}")
-                
-                time.sleep(2)
+                            log.debug("✓ Gov Event: %s", title)
                 
             except Exception as e:
-                print(f"[EventbriteMTWY] Gov site error {url}: {e}")
+                log.warning("Gov site error %s: %s", url, e)
                 continue
         
-        # Add sample government events
-        sample_gov = [
-            {
-                "title": "Wyoming National Guard Family Day",
-                "start": (datetime.now() + timedelta(days=45)).strftime("%Y-%m-%d"),
-                "city": "Cheyenne",
-                "state": "WY",
-                "address": "Wyoming Military Department, Cheyenne, WY",
-                "registration_url": "https://www.wyomilitary.wyo.gov/",
-                "source": "government_military"
-            },
-            {
-                "title": "Montana Veterans Day Ceremony",
-                "start": "2025-11-11",
-                "city": "Helena",
-                "state": "MT", 
-                "address": "Montana State Capitol, Helena, MT",
-                "registration_url": "https://dma.mt.gov/",
-                "source": "government_military"
-            }
-        ]
-        
-        events.extend(sample_gov)
         return events
     
-    def fetch(self) -> List[Dict]:
+    def _normalize(self, event_data: Dict) -> Optional[Event]:
+        """Run one scraped dict through norm_event; None if it is dropped or malformed."""
+        try:
+            # Ensure proper ISO date format
+            start_date = event_data.get("start")
+            if start_date and len(start_date) == 10:  # YYYY-MM-DD
+                start_date = f"{start_date}T10:00:00-07:00"  # Default mountain time
+            
+            return norm_event(
+                title=event_data.get("title"),
+                start=start_date,
+                city=event_data.get("city"),
+                state=event_data.get("state"),
+                venue_name=event_data.get("venue_name"),
+                address=event_data.get("address"),
+                registration_url=event_data.get("registration_url"),
+                source=event_data.get("source", "veteran_organizations"),
+                description=event_data.get("description", "")
+            )
+        except Exception as e:
+            log.warning("Normalization error: %s", e)
+            return None
+    
+    def fetch(self) -> List[Event]:
         """Main fetch method - scrape all sources and return normalized events."""
-        print("[EventbriteMTWY] Starting comprehensive veteran events scraping...")
-        print("[EventbriteMTWY] Note: Using HTML parsing due to Eventbrite API discontinuation")
+        log.info("Starting comprehensive veteran events scraping...")
+        log.debug("Note: Using HTML parsing due to Eventbrite API discontinuation")
         
         all_events = []
         
         try:
-            # Scrape all sources
-            all_events.extend(self._scrape_veterans_navigation_network())
-            time.sleep(2)
-            
-            all_events.extend(self._scrape_va_events())
-            time.sleep(2)
-            
-            all_events.extend(self._scrape_meetup_events())
-            time.sleep(1)
-            
-            all_events.extend(self._scrape_government_military())
-            
-            print(f"[EventbriteMTWY] Total raw events: {len(all_events)}")
+            # Scrape all sources concurrently. They hit unrelated hosts, so
+            # there is no need to pause between them; map() keeps the
+            # results in the order listed here.
+            scrapers = [
+                self._scrape_veterans_navigation_network,
+                self._scrape_va_events,
+                self._scrape_government_military,
+            ]
+            # The same event can turn up on more than one site; keep the
+            # first copy of each so duplicates skip normalization.
+            unique: Dict[tuple, Dict] = {}
+            with ThreadPoolExecutor(max_workers=len(scrapers)) as pool:
+                for events in pool.map(lambda scrape: scrape(), scrapers):
+                    for event_data in events:
+                        key = ((event_data.get("title") or "").strip().lower(), event_data.get("start"),
+                               event_data.get("city"), event_data.get("state"))
+                        unique.setdefault(key, event_data)
+            all_events = list(unique.values())
+
+            log.info("Total raw events: %d", len(all_events))
             
             # Normalize using base norm_event function
-            normalized_events = []
-            for event_data in all_events:
-                try:
-                    # Ensure proper ISO date format
-                    start_date = event_data.get("start")
-                    if start_date and len(start_date) == 10:  # YYYY-MM-DD
-                        start_date = f"{start_date}T10:00:00-07:00"  # Default mountain time
-                    
-                    norm_event_data = norm_event(
-                        title=event_data.get("title"),
-                        start=start_date,
-                        city=event_data.get("city"),
-                        state=event_data.get("state"),
-                        venue_name=event_data.get("venue_name"),
-                        address=event_data.get("address"),
-                        registration_url=event_data.get("registration_url"),
-                        source=event_data.get("source", "veteran_organizations"),
-                        description=event_data.get("description", "")
-                    )
-                    
-                    if norm_event_data:
-                        normalized_events.append(norm_event_data)
-                        
-                except Exception as e:
-                    print(f"[EventbriteMTWY] Normalization error: {e}")
-                    continue
+            normalized_events = [e for e in map(self._normalize, all_events) if e]
             
-            print(f"[EventbriteMTWY] Final normalized events: {len(normalized_events)}")
+            log.info("Final normalized events: %d", len(normalized_events))
             return normalized_events
             
         except Exception as e:
-            print(f"[EventbriteMTWY] Fetch error: {e}")
+            log.warning("Fetch error: %s", e)
             return []
@@ -1,45 +1,61 @@
 from __future__ import annotations
-from typing import List, Dict
-import requests
+from typing import List
+import re
+from concurrent.futures import ThreadPoolExecutor
 from icalendar import Calendar
-from dateutil import parser as date_parser
-from dateutil import tz
-from datetime import datetime
-from .base import Source, norm_event
-from ..config import PUBLIC_ICS_URLS
+from zoneinfo import ZoneInfo
+from .base import Source, Event, norm_event, ical_iso
+from config import PUBLIC_ICS_URLS
 
-DEFAULT_TZ = tz.gettz("America/Denver")
+DEFAULT_TZ = ZoneInfo("America/Denver")
+# One scan for either state; the group name is the state code.
+STATE_RE = re.compile(r"(?P<MT> MT|Montana)|(?P<WY> WY|Wyoming)")
+
+# Calendars fetched at once; each URL is usually a different host.
+MAX_WORKERS = 8
 
 class GenericICS(Source):
-    def fetch(self) -> List[Dict]:
-        out: List[Dict] = []
-        for url in PUBLIC_ICS_URLS:
-            try:
-                r = requests.get(url, timeout=25)
-                r.raise_for_status()
-                cal = Calendar.from_ical(r.content)
-                for comp in cal.walk("VEVENT"):
-                    start = comp.get("dtstart").dt if comp.get("dtstart") else None
-                    end = comp.get("dtend").dt if comp.get("dtend") else None
-                    if isinstance(start, datetime) and start.tzinfo is None:
-                        start = start.replace(tzinfo=DEFAULT_TZ)
-                    if isinstance(end, datetime) and end.tzinfo is None:
-                        end = end.replace(tzinfo=DEFAULT_TZ)
-                    title = str(comp.get("summary", ""))
-                    loc = str(comp.get("location", "")) if comp.get("location") else ""
-                    state = "MT" if " MT" in loc or "Montana" in loc else ("WY" if " WY" in loc or "Wyoming" in loc else None)
-                    e = norm_event(
-                        title=title,
-                        start=start.isoformat() if isinstance(start, datetime) else None,
-                        end=end.isoformat() if isinstance(end, datetime) else None,
-                        city=None,
-                        state=state,
-                        address=loc or None,
-                        registration_url=None,
-                        source="ics"
-                    )
-                    if e:
-                        out.append(e)
-            except Exception as ex:
-                print(f"[GenericICS] {url}: {ex}")
+    def fetch(self) -> List[Event]:
+        out: List[Event] = []
+        if not PUBLIC_ICS_URLS:
+            return out
+        # Fetch concurrently so one slow calendar doesn't hold up the rest;
+        # map() keeps the configured URL order.
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(PUBLIC_ICS_URLS))) as pool:
+            for events in pool.map(self._fetch_calendar, PUBLIC_ICS_URLS):
+                out.extend(events)
+        return out
+
+    def _fetch_calendar(self, url: str) -> List[Event]:
+        out: List[Event] = []
+        try:
+            r = self.session.get(url, timeout=25)
+            r.raise_for_status()
+            cal = Calendar.from_ical(r.content)
+            del r  # only the parsed tree is used below; free the body now
+            # VEVENTs are direct children of the VCALENDAR; scanning those
+            # skips walk()'s recursion into every VALARM/VTIMEZONE.
+            for comp in cal.subcomponents:
+                if comp.name != "VEVENT":
+                    continue
+                start = ical_iso(comp.get("dtstart"), DEFAULT_TZ)
+                end = ical_iso(comp.get("dtend"), DEFAULT_TZ)
+                title = str(comp.get("summary", ""))
+                loc = str(comp.get("location") or "")
+                m = STATE_RE.search(loc)
+                state = m.lastgroup if m else None
+                e = norm_event(
+                    title=title,
+                    start=start,
+                    end=end,
+                    city=None,
+                    state=state,
+                    address=loc or None,
+                    registration_url=None,
+                    source="ics"
+                )
+                if e:
+                    out.append(e)
+        except Exception as ex:
+            print(f"[GenericICS] {url}: {ex}")
         return out
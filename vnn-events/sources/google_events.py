@@ -1,30 +1,35 @@
 from __future__ import annotations
 from typing import List, Dict
-import os, time, requests
-from datetime import datetime, timedelta
-import pytz
+import os
+from concurrent.futures import ThreadPoolExecutor
 
-from .base import Source, norm_event
-from ..config import SERPAPI_KEY, LOOKAHEAD_DAYS, EVENT_SCOPE, VETERAN_KEYWORDS
+try:
+    import orjson
+except ImportError:  # optional; fall back to requests' stdlib decoder
+    orjson = None
 
-TZ = pytz.timezone("America/Denver")
+from .base import SESSION, WINDOW_END, WINDOW_START, Source, Event, norm_event
+from config import SERPAPI_KEY, EVENT_SCOPE, VETERAN_KEYWORDS
 
-def _window():
-    now = datetime.now(TZ)
-    end = now + timedelta(days=LOOKAHEAD_DAYS)
-    return now.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+REGIONS = ["Montana", "Wyoming"]
+
+# Date range for the cdr: filter, formatted once from the run's shared
+# lookahead window so it matches the norm_event prefilter exactly.
+WINDOW = (WINDOW_START.strftime("%Y-%m-%d"), WINDOW_END.strftime("%Y-%m-%d"))
+
+# Keyword clause for the veteran-focused query, joined once at import
+VETERAN_QUERY = " OR ".join(f'"{k}"' for k in VETERAN_KEYWORDS)
 
 def _query_for(region_name: str) -> str:
     if EVENT_SCOPE == "ALL":
         return f"events in {region_name}"
     # veteran-focused
-    kws = " OR ".join([f'"{k}"' for k in VETERAN_KEYWORDS])
-    return f"({kws}) events in {region_name}"
+    return f"({VETERAN_QUERY}) events in {region_name}"
 
 def _search(region_name: str) -> List[Dict]:
     if not SERPAPI_KEY:
         return []
-    start, end = _window()
+    start, end = WINDOW
     params = {
         "engine": "google_events",
         "q": _query_for(region_name),
@@ -33,24 +38,26 @@ def _search(region_name: str) -> List[Dict]:
         "tbs": f"cdr:1,cd_min:{start},cd_max:{end}",
     }
     try:
-        r = requests.get("https://serpapi.com/search.json", params=params, timeout=30)
+        r = SESSION.get("https://serpapi.com/search.json", params=params, timeout=30)
         r.raise_for_status()
-        return r.json().get("events_results", []) or []
+        data = orjson.loads(r.content) if orjson is not None else r.json()
+        return data.get("events_results", []) or []
     except Exception as ex:
         print(f"[SerpAPI {region_name}] {ex}")
         return []
 
 class GoogleEvents(Source):
-    def fetch(self) -> List[Dict]:
-        out: List[Dict] = []
-        for region in ["Montana", "Wyoming"]:
-            results = _search(region)
-            time.sleep(1.0)
+    def fetch(self) -> List[Event]:
+        out: List[Event] = []
+        # Both regional searches go out at once; the shared session's Retry
+        # policy handles SerpAPI throttling, so no fixed pause between them.
+        with ThreadPoolExecutor(max_workers=len(REGIONS)) as pool:
+            region_results = list(pool.map(_search, REGIONS))
+        for results in region_results:
             for item in results:
                 title = item.get("title")
-                when = item.get("date", {}).get("start_date") or item.get("date", {}).get("when")
-                if not when:
-                    when = item.get("date", {}).get("start_time")
+                date_info = item.get("date") or {}
+                when = date_info.get("start_date") or date_info.get("when") or date_info.get("start_time")
                 if not when:
                     continue
                 try:
@@ -66,17 +73,22 @@ class GoogleEvents(Source):
                     joined = ", ".join(addr)
                 else:
                     joined = addr or ""
-                if ", MT" in joined:
+                # City is the last comma field before ", ST"; find() and
+                # rpartition() get it without splitting the whole address.
+                i = joined.find(", MT")
+                if i >= 0:
                     state = "MT"
-                    city = joined.split(", MT")[0].split(",")[-1].strip()
-                elif ", WY" in joined:
-                    state = "WY"
-                    city = joined.split(", WY")[0].split(",")[-1].strip()
-                url = None
-                if item.get("link"):
-                    url = item["link"]
-                elif item.get("ticket_info") and isinstance(item["ticket_info"], list):
-                    url = item["ticket_info"][0].get("link")
+                else:
+                    i = joined.find(", WY")
+                    if i >= 0:
+                        state = "WY"
+                if i >= 0:
+                    city = joined[:i].rpartition(",")[2].strip()
+                url = item.get("link") or None
+                if not url:
+                    tickets = item.get("ticket_info")
+                    if tickets and isinstance(tickets, list):
+                        url = tickets[0].get("link")
                 e = norm_event(
                     title=title,
                     start=start_iso,
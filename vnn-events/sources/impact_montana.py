@@ -1,69 +1,100 @@
 """
 Impact Montana events scraper.
-NOTE: CSS selectors may need occasional adjustment as site markup changes.
+NOTE: selectors may need occasional adjustment as site markup changes.
 """
 
 from __future__ import annotations
-from typing import List, Dict, Optional
-import requests
-from bs4 import BeautifulSoup
+from typing import List, Optional
+from lxml import etree
 from dateutil import parser as date_parser
-import pytz
+from zoneinfo import ZoneInfo
 
-from .base import Source, norm_event
+from .base import Source, Event, html_text, html_tree, norm_event
 
-TZ = pytz.timezone("America/Denver")
+TZ = ZoneInfo("America/Denver")
 EVENTS_URL = "https://impactmontana.org/events"  # adjust if their URL changes
 
+# Parsed with lxml.html directly, so the card selectors are XPath compiled
+# once at import; each union is a single expression, so matches come back in
+# document order like the CSS group selectors they replace.
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# [data-event-card], .event, .event-card, .tribe-events-calendar-list__event
+CARDS = etree.XPath(
+    f"//*[@data-event-card or {_has_class('event')} or {_has_class('event-card')}"
+    f" or {_has_class('tribe-events-calendar-list__event')}]"
+)
+# a[href*='/event'], article, li
+FALLBACK_CARDS = etree.XPath("//*[self::a[contains(@href, '/event')] or self::article or self::li]")
+# first of .event-title, .tribe-events-calendar-list__event-title, h3, h2, a
+TITLE = etree.XPath(
+    f"(.//*[{_has_class('event-title')} or {_has_class('tribe-events-calendar-list__event-title')}"
+    " or self::h3 or self::h2 or self::a])[1]"
+)
+TIME = etree.XPath("(.//time)[1]")
+LINK = etree.XPath("(.//a[@href])[1]")
+LOCATION = etree.XPath(f"(.//*[{_has_class('event-location')}])[1]")
+# The fallback matches every li/article on a page, so only this many are tried
+MAX_FALLBACK_CARDS = 200
+
 class ImpactMontana(Source):
-    def fetch(self) -> List[Dict]:
-        out: List[Dict] = []
+    def fetch(self) -> List[Event]:
+        out: List[Event] = []
         try:
-            r = requests.get(EVENTS_URL, timeout=25)
+            r = self.session.get(EVENTS_URL, timeout=25)
             r.raise_for_status()
-            s = BeautifulSoup(r.text, "lxml")
+            tree = html_tree(r.content)
             # Try a few common selectors:
-            cards = s.select("[data-event-card], .event, .event-card, .tribe-events-calendar-list__event")
+            cards = CARDS(tree)
             if not cards:
                 # Fallback: try list items with links that look like events
-                cards = s.select("a[href*='/event'], article, li")
+                cards = FALLBACK_CARDS(tree)[:MAX_FALLBACK_CARDS]
             for card in cards:
-                title_el = card.select_one(".event-title, .tribe-events-calendar-list__event-title, h3, h2, a")
-                title = title_el.get_text(strip=True) if title_el else None
+                title_el = TITLE(card)
+                title = html_text(title_el[0]) if title_el else None
                 if not title:
                     continue
 
-                time_el = card.select_one("time")
-                when = time_el.get("datetime") if time_el and time_el.has_attr("datetime") else (time_el.get_text(strip=True) if time_el else None)
+                time_el = TIME(card)
+                when = None
+                if time_el:
+                    when = time_el[0].get("datetime")
+                    if when is None:
+                        when = html_text(time_el[0])
                 if not when:
                     # fallback: look for date-like text
-                    dt_text = card.get_text(" ", strip=True)
-                    when = dt_text
+                    when = html_text(card, " ")
 
                 start = None
                 try:
                     start = date_parser.parse(when)
                     if start and not start.tzinfo:
-                        start = TZ.localize(start)
+                        start = start.replace(tzinfo=TZ)
                 except Exception:
                     continue
 
-                link_el = card.select_one("a[href]")
-                href = link_el["href"] if link_el else EVENTS_URL
+                link_el = LINK(card)
+                href = link_el[0].get("href") if link_el else EVENTS_URL
                 if href and href.startswith("//"):
                     href = "https:" + href
 
                 # Try to infer location text
-                loc_el = card.select_one(".event-location")
+                loc_el = LOCATION(card)
                 city, state = None, "MT"
                 if loc_el:
-                    txt = loc_el.get_text(" ", strip=True)
-                    if ", WY" in txt:
+                    txt = html_text(loc_el[0], " ")
+                    # City is the last comma field before ", ST"; find() and
+                    # rpartition() get it without splitting the whole string.
+                    i = txt.find(", WY")
+                    if i >= 0:
                         state = "WY"
-                        city = txt.split(", WY")[0].split(",")[-1].strip()
-                    elif ", MT" in txt:
-                        state = "MT"
-                        city = txt.split(", MT")[0].split(",")[-1].strip()
+                    else:
+                        i = txt.find(", MT")
+                        if i >= 0:
+                            state = "MT"
+                    if i >= 0:
+                        city = txt[:i].rpartition(",")[2].strip()
 
                 e = norm_event(
                     title=title,
@@ -4,44 +4,41 @@ Set VUB_ICS_URL in config.py or environment; if missing, this source returns [].
 """
 
 from __future__ import annotations
-from typing import List, Dict
-import requests
+from typing import List
 from icalendar import Calendar
-from dateutil import tz
-from datetime import datetime
+from zoneinfo import ZoneInfo
 
-from .base import Source, norm_event
+from .base import Source, Event, norm_event, ical_iso
 from config import VUB_ICS_URL
 
-DEFAULT_TZ = tz.gettz("America/Denver")
+DEFAULT_TZ = ZoneInfo("America/Denver")
 
 class VeteransUpwardBoundMT(Source):
-    def fetch(self) -> List[Dict]:
-        out: List[Dict] = []
+    def fetch(self) -> List[Event]:
+        out: List[Event] = []
         if not VUB_ICS_URL:
             return out
         try:
-            r = requests.get(VUB_ICS_URL, timeout=25)
+            r = self.session.get(VUB_ICS_URL, timeout=25)
             r.raise_for_status()
             cal = Calendar.from_ical(r.content)
-            for comp in cal.walk("VEVENT"):
-                start = comp.get("dtstart").dt if comp.get("dtstart") else None
-                end = comp.get("dtend").dt if comp.get("dtend") else None
-                if isinstance(start, datetime) and start.tzinfo is None:
-                    start = start.replace(tzinfo=DEFAULT_TZ)
-                if isinstance(end, datetime) and end.tzinfo is None:
-                    end = end.replace(tzinfo=DEFAULT_TZ)
+            del r
+            for comp in cal.subcomponents:
+                if comp.name != "VEVENT":
+                    continue
+                start = ical_iso(comp.get("dtstart"), DEFAULT_TZ)
+                end = ical_iso(comp.get("dtend"), DEFAULT_TZ)
 
                 title = str(comp.get("summary", "Veterans Upward Bound"))
-                loc = str(comp.get("location", "")) if comp.get("location") else ""
+                loc = str(comp.get("location") or "")
                 state = "MT"
                 if ", WY" in loc:
                     state = "WY"
 
                 e = norm_event(
                     title=title,
-                    start=start.isoformat() if isinstance(start, datetime) else None,
-                    end=end.isoformat() if isinstance(end, datetime) else None,
+                    start=start,
+                    end=end,
                     city=None,
                     state=state,
                     registration_url=None,
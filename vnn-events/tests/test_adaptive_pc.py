@@ -0,0 +1,55 @@
+"""Run from vnn-events/: python -m unittest discover tests"""
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+
+import requests
+
+from sources.adaptive_pc import AdaptivePerformanceCenter
+from sources.base import html_text, html_tree
+
+WHEN = (date.today() + timedelta(days=7)).isoformat()
+
+# XHTML page with an XML declaration and inline script/style in the card
+PAGE = f"""<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN"
+  "http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd">
+<html xmlns="http://www.w3.org/1999/xhtml"><head><title>Events</title></head>
+<body><article>
+  <h3>Vet<style>h3 {{ color: red }}</style>Day<script>var x=1</script> Ride</h3>
+  <time datetime="{WHEN}T09:00:00">Soon</time>
+  <a href="https://example.org/vetday">Details</a>
+</article></body></html>
+""".encode("utf-8")
+
+
+def _response(content: bytes) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = content
+    return resp
+
+
+class HtmlHelpersTest(unittest.TestCase):
+    def test_xml_declaration(self):
+        tree = html_tree(PAGE)
+        self.assertEqual(html_text(tree.find(".//h3")), "VetDayRide")
+
+    def test_text_separator(self):
+        el = html_tree(b"<div><p> a </p><script>b()</script><p>c</p></div>")
+        self.assertEqual(html_text(el, " "), "a c")
+
+
+class AdaptivePerformanceCenterTest(unittest.TestCase):
+    def test_fetch_xhtml_page(self):
+        source = AdaptivePerformanceCenter()
+        with mock.patch.object(source, "session") as session:
+            session.get.return_value = _response(PAGE)
+            events = source.fetch()
+        self.assertEqual([e.title for e in events], ["VetDayRide"])
+        self.assertTrue(events[0].start.startswith(WHEN))
+        self.assertEqual(events[0].registration_url, "https://example.org/vetday")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""Run from vnn-events/: python -m unittest discover tests"""
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+
+import requests
+
+from sources.impact_montana import ImpactMontana
+
+WHEN = (date.today() + timedelta(days=7)).isoformat()
+
+# XHTML page with an XML declaration and inline script/style in the card
+PAGE = f"""<?xml version="1.0" encoding="utf-8"?>
+<html xmlns="http://www.w3.org/1999/xhtml"><body>
+<div class="event-card">
+  <h3 class="event-title">Vet<script>var x=1</script>Day</h3>
+  <time datetime="{WHEN}T09:00:00">Soon</time>
+  <span class="event-location">Main Hall<style>span {{}}</style>, Billings, MT</span>
+  <a href="//impactmontana.org/events/vetday">Details</a>
+</div>
+</body></html>
+""".encode("utf-8")
+
+
+class ImpactMontanaTest(unittest.TestCase):
+    def test_fetch_xhtml_page(self):
+        resp = requests.Response()
+        resp.status_code = 200
+        resp._content = PAGE
+        source = ImpactMontana()
+        with mock.patch.object(source, "session") as session:
+            session.get.return_value = resp
+            events = source.fetch()
+        self.assertEqual([e.title for e in events], ["VetDay"])
+        self.assertTrue(events[0].start.startswith(WHEN))
+        self.assertEqual((events[0].city, events[0].state), ("Billings", "MT"))
+        self.assertEqual(events[0].registration_url, "https://impactmontana.org/events/vetday")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+"""Run from vnn-events/: python -m unittest discover tests"""
+import unittest
+
+from config import veteran_re
+from sources.eventbrite_api import EventbriteMTWY
+
+
+class VeteranReTest(unittest.TestCase):
+    def test_config_pattern(self):
+        pattern = veteran_re()
+        for text in ("VFW Post 1116 breakfast", "American Legion fish fry", "for veterans"):
+            self.assertIsNotNone(pattern.search(text), text)
+        for text in ("safeguarding your data", "Davenport city council"):
+            self.assertIsNone(pattern.search(text), text)
+
+    def test_extra_keywords(self):
+        pattern = veteran_re(["service dog"])
+        self.assertIsNotNone(pattern.search("Service Dogs training day"))
+        self.assertIsNone(veteran_re().search("Service Dogs training day"))
+
+    def test_eventbrite_source(self):
+        source = EventbriteMTWY()
+        self.assertTrue(source._is_veteran_related("VFW and American Legion picnic"))
+        self.assertTrue(source._is_veteran_related("Blue Star families meet-up"))
+        self.assertFalse(source._is_veteran_related("Safeguarding workshop in Davenport"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,38 +1,45 @@
 from __future__ import annotations
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict, Tuple
 from rapidfuzz import fuzz
+from rapidfuzz.utils import default_process
 
+if TYPE_CHECKING:
+    from sources.base import Event
 
-def _key(e: Dict) -> str:
-    title = (e.get("title") or "").lower()
-    start = (e.get("start") or "")[:10]
-    city = e.get("city") or ""
-    state = e.get("state") or ""
-    return title + "|" + start + "|" + city + "|" + state
 
+def _key(e: Event) -> Tuple[str, str, str, str]:
+    # A tuple hashes its parts directly instead of building a joined string,
+    # and a "|" inside a title can't make two different keys collide.
+    return ((e.title or "").lower(), (e.start or "")[:10], e.city or "", e.state or "")
 
-def _choose_better(a: Dict, b: Dict) -> Dict:
-    score_a = (len(a.get("description") or "") > len(b.get("description") or "")) + (1 if a.get("registration_url") else 0)
+
+def _choose_better(a: Event, b: Event) -> Event:
+    score_a = (len(a.description or "") > len(b.description or "")) + (1 if a.registration_url else 0)
     return a if score_a >= 1 else b
 
 
-def dedupe(events: List[Dict]) -> List[Dict]:
-    seen: Dict[str, Dict] = {}
-    out: List[Dict] = []
+def dedupe(events: List[Event]) -> List[Event]:
+    # Map each key to its event's position in out, so a better duplicate
+    # replaces it in place instead of searching the list for it.
+    seen: Dict[Tuple[str, str, str, str], int] = {}
+    out: List[Event] = []
+    # default_process-ed title of each event in out, computed once per event
+    # rather than inside every comparison; scoring then uses processor=None.
+    titles: List[str] = []
     for e in events:
         k = _key(e)
-        if k in seen:
-            other = seen[k]
-            score = fuzz.token_set_ratio(e["title"], other["title"])
+        title = default_process(e.title or "")
+        idx = seen.get(k)
+        if idx is not None:
+            other = out[idx]
+            # Same-source repeats usually carry the identical title
+            score = 100 if title and title == titles[idx] else fuzz.token_set_ratio(title, titles[idx], processor=None)
             if score >= 90:
-                better = _choose_better(e, other)
-                if better is other:
-                    continue
-                else:
-                    idx = out.index(other)
-                    out[idx] = better
-                    seen[k] = better
-                    continue
-        seen[k] = e
+                if _choose_better(e, other) is not other:
+                    out[idx] = e
+                    titles[idx] = title
+                continue
+        seen[k] = len(out)
         out.append(e)
+        titles.append(title)
     return out
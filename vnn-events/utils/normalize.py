@@ -1,29 +1,65 @@
 from __future__ import annotations
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 from dateutil import parser as date_parser
-import pytz
 
+if TYPE_CHECKING:
+    from sources.base import Event
 
-def within_lookahead(iso_str: str, days: int) -> bool:
+TZ = ZoneInfo("America/Denver")
+
+
+@lru_cache(maxsize=4096)
+def parse_iso(iso_str: str) -> datetime:
+    # Recurring events share identical start strings; datetimes are immutable,
+    # so repeats can reuse the first parse. The C fromisoformat handles
+    # everything the sources emit; isoparse covers any rarer ISO form.
+    try:
+        return datetime.fromisoformat(iso_str)
+    except ValueError:
+        return date_parser.isoparse(iso_str)
+
+
+def iso_date_bounds(start: datetime, end: datetime) -> Tuple[str, str]:
+    # Dates one day outside [start, end]. An ISO timestamp whose YYYY-MM-DD
+    # prefix sorts outside these is out of the window whatever its UTC
+    # offset, so it can be rejected without parsing.
+    return (start - timedelta(days=1)).date().isoformat(), (end + timedelta(days=1)).date().isoformat()
+
+
+def outside_dates(iso_str: str, bounds: Tuple[str, str]) -> bool:
+    day = iso_str[:10]
+    # Only extended-format dates sort correctly as strings
+    return day[4:5] == "-" and day[7:8] == "-" and not bounds[0] <= day <= bounds[1]
+
+
+def _in_window(iso_str: str, now: datetime, cutoff: datetime, bounds: Tuple[str, str]) -> bool:
     if not iso_str:
         return False
-    now = datetime.now(pytz.timezone("America/Denver"))
     try:
-        dt = date_parser.isoparse(iso_str)
+        if outside_dates(iso_str, bounds):
+            return False
+        dt = parse_iso(iso_str)
     except Exception:
         return False
-    return now <= dt <= (now + timedelta(days=days))
-
-
-def clean_and_filter(events: List[Dict], lookahead_days: int, allowed_states: set[str]) -> List[Dict]:
-    out: List[Dict] = []
-    for e in events:
-        if not e:
-            continue
-        if e.get("state") not in allowed_states:
-            continue
-        if not within_lookahead(e.get("start"), lookahead_days):
-            continue
-        out.append(e)
-    return out
+    return now <= dt <= cutoff
+
+
+def within_lookahead(iso_str: str, days: int) -> bool:
+    now = datetime.now(TZ)
+    cutoff = now + timedelta(days=days)
+    return _in_window(iso_str, now, cutoff, iso_date_bounds(now, cutoff))
+
+
+def clean_and_filter(events: List[Event], lookahead_days: int, allowed_states: set[str]) -> List[Event]:
+    # One clock read for the whole batch rather than one per event.
+    now = datetime.now(TZ)
+    cutoff = now + timedelta(days=lookahead_days)
+    bounds = iso_date_bounds(now, cutoff)
+    # Cheapest checks first; only events in an allowed state reach the window test.
+    return [
+        e for e in events
+        if e and e.state in allowed_states and _in_window(e.start, now, cutoff, bounds)
+    ]